@@ -2,56 +2,322 @@
 Configuration file for Article Image Scraper Pipeline
 
 Modify these settings to customize the behavior of the image scraper.
+
+Every setting can also be overridden per run without editing this file:
+point ``SCRAPER_CONFIG`` at a TOML file whose top-level keys are setting
+names (e.g. ``min_image_size = [200, 200]``), or set an environment variable
+named ``SCRAPER_<SETTING>`` (e.g. ``SCRAPER_REQUEST_TIMEOUT=10``).
+Environment variables take precedence over the TOML file.
 """
 
+import os
+import re
+import types
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple
+from urllib.parse import urlsplit
+
+from urllib3.util import make_headers
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+
+@dataclass(frozen=True)
+class ScraperConfig:
+    """Immutable scraper settings; the field defaults are the shipped values."""
+
+    # Image filtering settings
+    min_image_size: Tuple[int, int] = (100, 100)  # Minimum width x height in pixels
+    max_file_size_mb: int = 10  # Maximum file size in MB
+    allowed_extensions: FrozenSet[str] = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.svg'})
+
+    # Scoring thresholds
+    min_acceptable_score: int = 40  # Minimum score to accept an image
+    trafilatura_threshold: int = 80  # Score threshold for trafilatura method
+    newspaper_threshold: int = 70   # Score threshold for newspaper3k method
+    opengraph_threshold: int = 80  # Score threshold for the meta-tag-only pass
+    accept_score: int = 85  # Validated image at or above this ends extraction at once
+
+    # Network settings
+    request_timeout: int = 30  # Timeout for page fetches and image downloads in seconds
+    probe_timeout: int = 10  # Timeout for the ranged image size probes in seconds
+    retry_attempts: int = 3    # Number of retry attempts for failed requests
+    host_failure_limit: int = 5  # Consecutive connection failures before a host is skipped (0 disables)
+    request_delay: float = 0.0   # Minimum gap in seconds between requests to the same host (0 disables)
+    max_workers: int = 8  # Articles processed concurrently
+    processes: int = 1  # Worker processes, each running max_workers threads
+    max_per_host: int = 4  # Concurrent requests allowed to a single host
+    max_connections: int = 20  # Concurrent requests allowed across all hosts
+    pool_hosts: int = 64  # Hosts whose keep-alive connections are kept open
+    validation_workers: int = 8  # Candidate images size-checked in parallel
+    download_workers: int = 8  # Chosen images downloaded and saved in parallel
+    queue_size: int = 1000  # Input files read ahead of the workers at most
+    http_cache: str = 'scraper_cache.sqlite'  # requests-cache SQLite file ('' disables)
+    http_cache_expire: int = 86400  # Seconds before cached responses expire
+    result_cache: str = '.pipeline_cache.db'  # Best-image cache in the output folder, reused across runs ('' disables)
+
+    # User agent for requests
+    user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+    # Image processing settings
+    jpg_quality: int = 85  # JPEG quality (1-100)
+    optimize_jpg: bool = False  # Extra Huffman pass: ~2x encode time for slightly smaller files
+    progressive_jpg: bool = True  # Save progressive JPEGs
+    max_image_dimension: int = 1280  # Longest side of saved images, 0 to keep original size
+
+    # Logging settings
+    log_level: str = 'INFO'  # DEBUG, INFO, WARNING, ERROR
+    log_file: str = 'scraper.log'  # '' logs to the console only
+
+    # Output settings
+    output_folder: str = 'articles+images'
+    max_images_per_article: int = 1  # Always 1 for this pipeline
+
+    # Tracking pixel patterns to exclude. Domains are ordered by how often
+    # they typically show up on news pages, so any() scans over the list
+    # short-circuit early
+    tracking_domains: Tuple[str, ...] = (
+        'google-analytics.com', 'doubleclick.net', 'googletagmanager.com',
+        'facebook.com', 'googlesyndication.com', 'googleadservices.com',
+        'amazon-adsystem.com', 'outbrain.com', 'taboola.com'
+    )
+
+    tracking_patterns: Tuple[str, ...] = (
+        'facebook.com/tr', 'google-analytics.com', '/pixel?', '/track?',
+        '/beacon?', '/analytics?', 'googletagmanager.com'
+    )
+
+    # Logo, ad and UI patterns whose images are excluded outright (checked in
+    # URLs, alt text and class names). Branding words such as 'brand',
+    # 'header' or 'watermark' are score penalties in the pipeline instead:
+    # as substrings they would also drop e.g. /markets/ or article-header images
+    logo_patterns: Tuple[str, ...] = (
+        r'logo', r'icon', r'favicon', r'avatar', r'profile',
+        r'advertisement', r'ad[_-]', r'banner', r'widget',
+        r'social', r'share', r'button', r'arrow', r'play',
+        r'thumbnail.*small', r'thumb.*\d+x\d+', r'\d+x\d+.*thumb',
+    )
+
+
+def _coerce(name: str, default: Any, value: Any) -> Any:
+    """Convert a TOML or environment value to the type of the field default."""
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes', 'on')
+        return bool(value)
+    if isinstance(default, (int, float, str)):
+        return type(default)(value)
+    if isinstance(value, str):
+        value = [part.strip() for part in re.split(r'[,x]' if name == 'min_image_size' else ',', value)
+                 if part.strip()]
+    if name == 'min_image_size':
+        return tuple(int(part) for part in value)
+    return type(default)(value)
+
+
+def _load_toml_or_env() -> Dict[str, Any]:
+    """Collect setting overrides from the SCRAPER_CONFIG file and SCRAPER_* variables."""
+    defaults = {f.name: f.default for f in fields(ScraperConfig)}
+    overrides = {}
+
+    path = os.environ.get('SCRAPER_CONFIG')
+    if path:
+        if tomllib is None:
+            raise ImportError("Reading SCRAPER_CONFIG requires Python 3.11+ or the 'tomli' package")
+        with open(path, 'rb') as f:
+            for key, value in tomllib.load(f).items():
+                key = key.lower()
+                if key not in defaults:
+                    raise ValueError(f"Unknown setting '{key}' in {path}")
+                overrides[key] = value
+
+    for name in defaults:
+        value = os.environ.get(f'SCRAPER_{name.upper()}')
+        if value is not None:
+            overrides[name] = value
+
+    return {name: _coerce(name, defaults[name], value) for name, value in overrides.items()}
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ScraperConfig:
+    """Return the process-wide settings, loading overrides on first use."""
+    return ScraperConfig(**_load_toml_or_env())
+
+
+# Module-level names kept for backward compatibility
+_cfg = get_config()
+
 # Image filtering settings
-MIN_IMAGE_SIZE = (100, 100)  # Minimum width x height in pixels
-MAX_FILE_SIZE_MB = 10  # Maximum file size in MB
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.svg'}
+MIN_IMAGE_SIZE = _cfg.min_image_size
+MAX_FILE_SIZE_MB = _cfg.max_file_size_mb
+ALLOWED_EXTENSIONS = _cfg.allowed_extensions
+ALLOWED_EXT_NO_DOT = frozenset(ext.lstrip('.') for ext in ALLOWED_EXTENSIONS)
+
+# Derived limits, precomputed so per-image checks skip the unpack/multiply
+MIN_W, MIN_H = MIN_IMAGE_SIZE
+MIN_AREA = MIN_W * MIN_H
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
 # Scoring thresholds
-MIN_ACCEPTABLE_SCORE = 40  # Minimum score to accept an image
-TRAFILATURA_THRESHOLD = 80  # Score threshold for trafilatura method
-NEWSPAPER_THRESHOLD = 70   # Score threshold for newspaper3k method
+MIN_ACCEPTABLE_SCORE = _cfg.min_acceptable_score
+TRAFILATURA_THRESHOLD = _cfg.trafilatura_threshold
+NEWSPAPER_THRESHOLD = _cfg.newspaper_threshold
+OPENGRAPH_THRESHOLD = _cfg.opengraph_threshold
+ACCEPT_SCORE = _cfg.accept_score
+
+# Extractors in the order they are tried, each paired with the best score
+# that ends the chain once reached. The cheap meta-tag pass runs before the
+# heavier newspaper3k parse; BeautifulSoup is the last resort.
+EXTRACTION_LADDER = (
+    ('trafilatura', TRAFILATURA_THRESHOLD),
+    ('opengraph', OPENGRAPH_THRESHOLD),
+    ('newspaper', NEWSPAPER_THRESHOLD),
+    ('beautifulsoup', MIN_ACCEPTABLE_SCORE),
+)
 
 # Network settings
-REQUEST_TIMEOUT = 30  # Timeout for HTTP requests in seconds
-RETRY_ATTEMPTS = 3    # Number of retry attempts for failed requests
-REQUEST_DELAY = 0.5   # Delay between requests in seconds
+REQUEST_TIMEOUT = _cfg.request_timeout
+PROBE_TIMEOUT = _cfg.probe_timeout
+RETRY_ATTEMPTS = _cfg.retry_attempts
+HOST_FAILURE_LIMIT = _cfg.host_failure_limit
+REQUEST_DELAY = _cfg.request_delay
+MAX_WORKERS = _cfg.max_workers
+PROCESSES = _cfg.processes
+MAX_PER_HOST = _cfg.max_per_host
+MAX_CONNECTIONS = _cfg.max_connections
+POOL_HOSTS = _cfg.pool_hosts
+VALIDATION_WORKERS = _cfg.validation_workers
+DOWNLOAD_WORKERS = _cfg.download_workers
+QUEUE_SIZE = _cfg.queue_size
+HTTP_CACHE = _cfg.http_cache
+HTTP_CACHE_EXPIRE = _cfg.http_cache_expire
+RESULT_CACHE = _cfg.result_cache
 
 # User agent for requests
-USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+USER_AGENT = _cfg.user_agent
+
+# Every content coding urllib3 can decode here: gzip/deflate always, plus br
+# (and zstd) when brotli/zstandard are installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+# Headers built once and shared by every session; the bytes form is for
+# clients such as urllib3 that take pre-encoded header pairs
+DEFAULT_HEADERS = {'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+DEFAULT_HEADERS_BYTES = tuple((k.encode(), v.encode()) for k, v in DEFAULT_HEADERS.items())
 
 # Image processing settings
-JPG_QUALITY = 90  # JPEG quality (1-100)
-OPTIMIZE_JPG = True  # Enable JPEG optimization
+JPG_QUALITY = _cfg.jpg_quality
+OPTIMIZE_JPG = _cfg.optimize_jpg
+PROGRESSIVE_JPG = _cfg.progressive_jpg
+MAX_IMAGE_DIMENSION = _cfg.max_image_dimension
 
 # Logging settings
-LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING, ERROR
-LOG_FILE = 'scraper.log'
+LOG_LEVEL = _cfg.log_level
+LOG_FILE = _cfg.log_file
 
 # Output settings
-OUTPUT_FOLDER = 'articles+images'
-MAX_IMAGES_PER_ARTICLE = 1  # Always 1 for this pipeline
+OUTPUT_FOLDER = _cfg.output_folder
+MAX_IMAGES_PER_ARTICLE = _cfg.max_images_per_article
 
 # Tracking pixel patterns to exclude
-TRACKING_DOMAINS = [
-    'facebook.com', 'google-analytics.com', 'googletagmanager.com',
-    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
-    'outbrain.com', 'taboola.com', 'amazon-adsystem.com'
-]
+TRACKING_DOMAINS = list(_cfg.tracking_domains)
+TRACKING_PATTERNS = list(_cfg.tracking_patterns)
+
+# Reversed-label trie of tracking domains ('com' -> 'facebook' -> END), so a
+# host is checked right-to-left in O(labels) regardless of the domain count
+TRACKING_TRIE = {}
+for _domain in TRACKING_DOMAINS:
+    _node = TRACKING_TRIE
+    for _label in reversed(_domain.lower().split('.')):
+        _node = _node.setdefault(_label, {})
+    _node[None] = True
+
+
+def is_tracking_host(host: str) -> bool:
+    """Return True if the host is a tracking domain or one of its subdomains."""
+    node = TRACKING_TRIE
+    for label in reversed(host.lower().rstrip('.').split('.')):
+        node = node.get(label)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+
+# Single matcher over every tracking URL pattern, built once at import
+if ahocorasick is not None:
+    TRACKING_AC = ahocorasick.Automaton()
+    for _needle in TRACKING_PATTERNS:
+        TRACKING_AC.add_word(_needle, _needle)
+    TRACKING_AC.make_automaton()
+    TRACKING_RE = None
+else:
+    TRACKING_AC = None
+    TRACKING_RE = re.compile('|'.join(map(re.escape, TRACKING_PATTERNS)) or '(?!)')
+
+
+def is_tracking_url(url: str) -> bool:
+    """Return True if the URL is served from a tracking host or contains a tracking pattern."""
+    url = url.lower()
+    if is_tracking_host(urlsplit(url).hostname or ''):
+        return True
+    if TRACKING_AC is not None:
+        return next(TRACKING_AC.iter(url), None) is not None
+    return TRACKING_RE.search(url) is not None
 
-TRACKING_PATTERNS = [
-    'facebook.com/tr', 'google-analytics.com', '/pixel?', '/track?',
-    '/beacon?', '/analytics?', 'googletagmanager.com'
-]
 
 # Logo and branding patterns to exclude
-LOGO_PATTERNS = [
-    r'logo', r'icon', r'favicon', r'avatar', r'profile',
-    r'advertisement', r'ad[_-]', r'banner', r'widget',
-    r'social', r'share', r'button', r'arrow', r'play',
-    r'thumbnail.*small', r'thumb.*\d+x\d+', r'\d+x\d+.*thumb',
-    r'brand', r'header', r'masthead', r'watermark',
-    r'signature', r'emblem', r'badge', r'seal', r'mark'
+LOGO_PATTERNS = list(_cfg.logo_patterns)
+
+LOGO_RE = re.compile('|'.join(f'(?:{p})' for p in LOGO_PATTERNS) or '(?!)', re.IGNORECASE)
+
+# is_logo_url() matches plain substrings with `in`; only patterns with regex
+# metacharacters go through the (pre-compiled) regex engine
+LOGO_LITERALS = frozenset(p.lower() for p in LOGO_PATTERNS if re.escape(p) == p)
+_LOGO_METACHAR_RE = re.compile('|'.join(f'(?:{p})' for p in LOGO_PATTERNS if re.escape(p) != p) or '(?!)',
+                               re.IGNORECASE)
+
+
+def is_logo_url(url: str) -> bool:
+    """Return True if the URL matches any logo or branding pattern (same result as LOGO_RE.search)."""
+    url = url.lower()
+    return any(literal in url for literal in LOGO_LITERALS) or _LOGO_METACHAR_RE.search(url) is not None
+
+
+__all__ = [
+    'ScraperConfig', 'get_config',
+    'MIN_IMAGE_SIZE', 'MAX_FILE_SIZE_MB', 'ALLOWED_EXTENSIONS', 'ALLOWED_EXT_NO_DOT',
+    'MIN_W', 'MIN_H', 'MIN_AREA', 'MAX_FILE_SIZE_BYTES',
+    'MIN_ACCEPTABLE_SCORE', 'TRAFILATURA_THRESHOLD', 'NEWSPAPER_THRESHOLD',
+    'OPENGRAPH_THRESHOLD', 'ACCEPT_SCORE', 'EXTRACTION_LADDER',
+    'REQUEST_TIMEOUT', 'PROBE_TIMEOUT', 'RETRY_ATTEMPTS', 'HOST_FAILURE_LIMIT', 'REQUEST_DELAY',
+    'MAX_WORKERS', 'PROCESSES', 'MAX_PER_HOST', 'MAX_CONNECTIONS', 'POOL_HOSTS',
+    'VALIDATION_WORKERS', 'DOWNLOAD_WORKERS', 'QUEUE_SIZE',
+    'HTTP_CACHE', 'HTTP_CACHE_EXPIRE', 'RESULT_CACHE',
+    'USER_AGENT', 'ACCEPT_ENCODING', 'DEFAULT_HEADERS', 'DEFAULT_HEADERS_BYTES',
+    'JPG_QUALITY', 'OPTIMIZE_JPG', 'PROGRESSIVE_JPG', 'MAX_IMAGE_DIMENSION',
+    'LOG_LEVEL', 'LOG_FILE',
+    'OUTPUT_FOLDER', 'MAX_IMAGES_PER_ARTICLE',
+    'TRACKING_DOMAINS', 'TRACKING_PATTERNS', 'LOGO_PATTERNS',
+    'is_tracking_host', 'is_tracking_url', 'is_logo_url',
 ]
+
+# Read-only view of the settings above. The precompiled matchers are built
+# from these values at import time and are not rebuilt afterwards, so
+# change settings through SCRAPER_CONFIG / SCRAPER_* rather than by
+# assigning to module attributes.
+CONFIG = types.MappingProxyType({k: globals()[k] for k in __all__ if k.isupper()})
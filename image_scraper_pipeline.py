@@ -10,13 +10,22 @@ Requirements: See requirements.txt
 """
 
 import os
+import heapq
 import json
 import re
+import sqlite3
+import struct
 import time
 import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from urllib.parse import ParseResult, urljoin, urlparse
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -25,10 +34,243 @@ from urllib3.util.retry import Retry
 import trafilatura
 import trafilatura.metadata
 from newspaper import Article
-from bs4 import BeautifulSoup
+from newspaper import Config as NewspaperConfig
+from bs4 import UnicodeDammit
+import lxml.html
+from lxml import etree
 from PIL import Image
 import io
 
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional
+    requests_cache = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJFLAG_PROGRESSIVE, TJPF_RGB, TJSAMP_420
+except ImportError:  # PyTurboJPEG is optional
+    TurboJPEG = None
+
+import config
+
+
+# orjson parses JSON-LD blobs several times faster; its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _read_json(path: Path):
+    """Load a JSON file, with orjson when available."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path: Path, data) -> None:
+    """
+    Write pretty-printed UTF-8 JSON, with orjson when available (same layout as json.dump).
+    
+    The data goes to a temporary file next to path that then replaces it, so
+    a crash or a failed write never leaves a truncated JSON file behind. The
+    temporary name is unique per process and thread, in case two articles
+    sanitize to the same folder.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+# Characters not allowed in folder names, and runs of whitespace to collapse
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _iter_json_files(folder: Path) -> Iterator[Path]:
+    """
+    Yield the folder's *.json files as the directory is read (hidden files skipped, like glob).
+    
+    A missing folder yields nothing, as glob did.
+    """
+    try:
+        entries = os.scandir(folder)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file():
+                yield Path(entry.path)
+
+
+# Bonus per extraction method (prioritize trafilatura and newspaper main images)
+_SOURCE_METHOD_SCORES = {
+    'trafilatura_main': 30,  # Highest priority for main article image
+    'newspaper_top': 25,  # High priority for newspaper top image
+    'trafilatura': 15,
+    'newspaper': 10,
+    'soup': 5,
+}
+
+
+# htmldate parameters for trafilatura's metadata pass. The pipeline never uses
+# the publication date, so skip the extensive (and by far slowest) date search.
+# trafilatura writes the page URL into the dict it is given, so pass a copy.
+TRAFILATURA_DATE_CONFIG = {'extensive_search': False}
+
+
+@lru_cache(maxsize=8192)
+def _cached_urlparse(url: str) -> ParseResult:
+    """Parse a URL once; the same image URL goes through several checks."""
+    return urlparse(url)
+
+
+def _keyword_re(*terms: str) -> re.Pattern:
+    """Compile literal keywords into one alternation (same result as `any(t in s ...)`)."""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+
+def _parse_html(markup) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parse page bytes (or text) into an lxml document.
+    
+    The encoding is sniffed the same way BeautifulSoup does (BOM, declared
+    charset, then detection), since libxml2 otherwise assumes Latin-1.
+    Returns None for an empty document.
+    """
+    if isinstance(markup, str):
+        markup, encoding = markup.encode('utf-8'), 'utf-8'
+    else:
+        encoding = UnicodeDammit(markup, is_html=True).original_encoding
+    try:
+        return lxml.html.document_fromstring(markup, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        return None
+
+
+def _image_formats(data) -> Optional[Tuple[str, ...]]:
+    """
+    Pick the PIL decoder from the file's magic bytes.
+    
+    Passed as `formats=` to Image.open so it goes straight to the right
+    plugin instead of probing each registered one; None means probe all.
+    """
+    if data[:3] == b'\xff\xd8\xff':
+        return ('JPEG',)
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return ('PNG',)
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return ('GIF',)
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return ('WEBP',)
+    if data[:2] == b'BM':
+        return ('BMP',)
+    return None
+
+
+# Bytes requested up front when validating a candidate; enough for the
+# PNG/GIF/WebP/BMP headers and for most JPEGs
+HEADER_PROBE_BYTES = 4096
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _image_dimensions(data) -> Optional[Tuple[int, int]]:
+    """
+    Parse (width, height) from the start of a JPEG, PNG, GIF, WebP or BMP file.
+    
+    Returns None if the format is unknown or the header is not complete yet.
+    """
+    n = len(data)
+    if data[:3] == b'\xff\xd8\xff':
+        # Walk the marker segments up to the start-of-frame header
+        i = 2
+        while i + 4 <= n:
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:  # fill byte
+                i += 1
+            elif marker in _JPEG_SOF_MARKERS:
+                if i + 9 > n:
+                    return None
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            elif marker == 0x01 or 0xD0 <= marker <= 0xD8:  # no payload
+                i += 2
+            else:
+                i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+        return None
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        if n >= 24 and data[12:16] == b'IHDR':
+            return struct.unpack('>II', data[16:24])
+        return None
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        if n >= 10:
+            return struct.unpack('<HH', data[6:10])
+        return None
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        chunk = data[12:16]
+        if chunk == b'VP8 ' and n >= 30:
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L' and n >= 25:
+            bits = struct.unpack('<I', data[21:25])[0]
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X' and n >= 30:
+            return (int.from_bytes(data[24:27], 'little') + 1,
+                    int.from_bytes(data[27:30], 'little') + 1)
+        return None
+    if data[:2] == b'BM' and n >= 26:
+        if struct.unpack('<I', data[14:18])[0] == 12:  # OS/2 BITMAPCOREHEADER
+            return struct.unpack('<HH', data[18:22])
+        width, height = struct.unpack('<ii', data[18:26])
+        return width, abs(height)
+    return None
+
+
+def _class_string(element) -> str:
+    """Whitespace-normalized class attribute, as BeautifulSoup joins it."""
+    return ' '.join(element.get('class', '').split())
+
+
+# Compiled once; each runs as a single C-level tree walk
+_OG_IMAGE_XPATH = etree.XPath('(//meta[@property="og:image"])[1]/@content')
+_TWITTER_IMAGE_XPATH = etree.XPath('(//meta[@name="twitter:image"])[1]/@content')
+_JSON_LD_XPATH = etree.XPath('//script[@type="application/ld+json"]')
+_IMG_XPATH = etree.XPath('//img[@src or @data-src or @data-lazy-src]')
+_PICTURE_SRCSET_XPATH = etree.XPath('//picture//source/@srcset')
+_VISIBLE_TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style or ancestor::template)]')
+
+
+class HostSkippedError(requests.ConnectionError):
+    """Raised instead of sending a request to a host past HOST_FAILURE_LIMIT."""
+
 
 class ImageScraperPipeline:
     """
@@ -37,75 +279,291 @@ class ImageScraperPipeline:
     Uses a fallback chain: trafilatura -> newspaper3k -> BeautifulSoup
     """
     
-    def __init__(self, input_folder: str = ".", output_folder: str = "articles+images"):
+    def __init__(self, input_folder: str = ".", output_folder: str = config.OUTPUT_FOLDER,
+                 max_workers: int = config.MAX_WORKERS, processes: int = config.PROCESSES):
         """
         Initialize the scraper pipeline.
         
         Args:
             input_folder: Folder containing JSON files with article metadata
             output_folder: Output folder for organized articles and images
+            max_workers: Number of articles processed concurrently (per process)
+            processes: Number of worker processes the input files are split across
         """
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder)
+        self.max_workers = max(1, max_workers)
+        self.processes = max(1, processes)
         self.session = self._create_session()
+        # Images bypass the HTTP cache: requests-cache reads whole bodies before
+        # returning, which would defeat the ranged probe and the streaming size cap
+        self._image_session = self._create_session(cached=False)
+        
+        # Best image per article URL, so an article listed in several JSON
+        # files is fetched and parsed once (see _find_best_image)
+        self._best_images = {}
+        self._best_images_lock = threading.Lock()
+        # Probe results per image URL: logos, placeholders and stock photos
+        # recur across articles from the same site
+        self._probe_image_size = lru_cache(maxsize=10000)(self._probe_image_size)
+        
+        # Per-host request slots so concurrent workers don't hammer one site
+        self._host_semaphores = defaultdict(lambda: threading.BoundedSemaphore(config.MAX_PER_HOST))
+        self._host_semaphores_lock = threading.Lock()
+        # Consecutive connection failures per host (guarded by the same lock)
+        self._host_failures = defaultdict(int)
+        # Earliest monotonic time the next request to each host may start
+        self._host_next_request = {}
+        # Overall cap on in-flight requests, however many hosts are involved
+        self._connection_slots = threading.BoundedSemaphore(config.MAX_CONNECTIONS)
+        
+        # Shared pool for probing candidate images in parallel
+        self._validation_pool = ThreadPoolExecutor(max_workers=config.VALIDATION_WORKERS)
+        # Image downloads and JSON writes, handed off once an article is scraped
+        self._download_pool = ThreadPoolExecutor(max_workers=config.DOWNLOAD_WORKERS)
         self.logger = self._setup_logging()
+        self._turbojpeg = self._create_turbojpeg()
+        self._newspaper_config = self._create_newspaper_config()
         
         # Create output directory
         self.output_folder.mkdir(exist_ok=True)
         
-        # Image filtering settings
-        self.min_image_size = (100, 100)  # Minimum width x height
-        self.max_file_size_mb = 10  # Maximum file size in MB
-        self.allowed_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
-        self.max_images_per_article = 1  # Only download the most relevant image per article
+        # How often each extraction source supplied the chosen image
+        self.source_wins = Counter()
+        self._source_wins_lock = threading.Lock()
+        
+        # Last page parsed on each thread, so the meta tag check and the tag
+        # scan of the same article share one lxml tree
+        self._parsed_page = threading.local()
         
-        # Common patterns to exclude (ads, logos, icons, tracking pixels)
+        # Best image per article from earlier runs, shared by all threads
+        self._result_cache = self._open_result_cache()
+        self._result_cache_lock = threading.Lock()
+        
+        # Patterns to exclude on top of config.LOGO_PATTERNS (ads, logos and
+        # icons, matched by config.is_logo_url): tracking pixels and analytics
         self.exclude_patterns = [
-            r'logo', r'icon', r'favicon', r'avatar', r'profile',
-            r'advertisement', r'ad[_-]', r'banner', r'widget',
-            r'social', r'share', r'button', r'arrow', r'play',
-            r'thumbnail.*small', r'thumb.*\d+x\d+', r'\d+x\d+.*thumb',
-            # Tracking pixels and analytics
             r'facebook\.com/tr', r'google-analytics', r'googletagmanager',
             r'doubleclick', r'googlesyndication', r'adsystem',
             r'pixel\?', r'track\?', r'beacon\?', r'analytics',
             r'1x1\.gif', r'transparent\.gif', r'spacer\.gif'
         ]
         self.exclude_regex = re.compile('|'.join(self.exclude_patterns), re.IGNORECASE)
+        self._exclude_db = self._build_exclude_db()
+        self._exclude_scratch = threading.local()  # hyperscan scratch is per thread
+        
+        # Keyword groups for URL scoring. With pyahocorasick a URL is scanned
+        # once for all groups; otherwise once per group via compiled regexes
+        self._url_score_groups = [
+            # Positive indicators in URL
+            (('featured', 'main', 'hero', 'cover', 'article'), 20),
+            (('large', 'big', 'full', 'original'), 12),
+            (('wp-content/uploads',), 10),  # WordPress uploads (often article images)
+            # Content-specific URLs (not logos)
+            (('photo', 'image', 'pic', 'img'), 8),
+            # Strong negative indicators for logos and branding
+            (('logo', 'brand', 'header', 'masthead', 'watermark',
+              'signature', 'emblem', 'badge', 'seal', 'mark'), -25),
+            # Company/site branding detection
+            (('toi', 'timesofindia', 'company', 'corp'), -15),
+            # Tracking pixels and analytics (should never be selected as images)
+            (('facebook.com/tr', '/tr?'), -50),
+            (('analytics', 'tracking', 'pixel?', 'beacon?'), -40),
+            # Standard negative indicators
+            (('thumb', 'small', 'mini', 'icon'), -15),
+            (('ad', 'banner', 'widget', 'sidebar'), -20),
+            (('social', 'share', 'profile', 'avatar'), -10),
+            # Size indicators in URL (logos often have standard sizes)
+            (('150x', '200x', '100x', '50x'), -12),
+            (('x150', 'x200', 'x100', 'x50'), -12),
+        ]
+        self._url_score_rules = [(_keyword_re(*terms), weight) for terms, weight in self._url_score_groups]
+        self._url_score_ac = self._build_score_automaton()
+        self._alt_positive_re = _keyword_re('article', 'story', 'news', 'main', 'photo')
+        self._alt_negative_re = _keyword_re('logo', 'icon', 'button', 'arrow')
+        self._class_positive_re = _keyword_re('featured', 'hero', 'main')
+        self._class_negative_re = _keyword_re('sidebar', 'widget', 'ad', 'banner')
+        self._context_positive_re = _keyword_re('article', 'content', 'story', 'body', 'post', 'main', 'entry')
+        self._context_negative_re = _keyword_re('header', 'nav', 'footer', 'sidebar', 'menu', 'ad', 'widget')
+        self._tracking_param_re = _keyword_re('fbclid', 'gclid', 'utm_', 'pixel')
+        self._pixel_size_re = _keyword_re('width=1', 'height=1', '1x1')
+        # Known image CDN hosts are matched exactly; the generic host prefixes
+        # are still matched anywhere in the netloc
+        self._image_cdn_hosts = frozenset({'static.toiimg.com'})
+        self._image_cdn_re = _keyword_re('images.', 'img.', 'cdn.', 'assets.')
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration."""
+        handlers = [logging.StreamHandler()]
+        if config.LOG_FILE:
+            handlers.insert(0, logging.FileHandler(config.LOG_FILE))
         logging.basicConfig(
-            level=logging.INFO,
+            level=config.LOG_LEVEL.upper(),
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('scraper.log'),
-                logging.StreamHandler()
-            ]
+            handlers=handlers
         )
         return logging.getLogger(__name__)
 
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy and proper headers."""
-        session = requests.Session()
+    def _open_result_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite cache of chosen images kept in the output folder, or None if disabled."""
+        if not config.RESULT_CACHE:
+            return None
+        try:
+            conn = sqlite3.connect(str(self.output_folder / config.RESULT_CACHE), timeout=30,
+                                   isolation_level=None, check_same_thread=False)
+            # WAL lets worker processes read while another one writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            # One row per input file, so files sharing an article URL don't evict each other
+            conn.execute('CREATE TABLE IF NOT EXISTS results '
+                         '(path TEXT PRIMARY KEY, url TEXT, mtime REAL, payload TEXT)')
+            return conn
+        except sqlite3.Error as e:
+            self.logger.warning(f"Result cache disabled: {e}")
+            return None
+
+    def _cached_result(self, json_file_path: Path, url: str, mtime: float) -> Optional[Dict[str, any]]:
+        """Return the image chosen for an input file on an earlier run, if the file is unchanged."""
+        if self._result_cache is None:
+            return None
+        try:
+            with self._result_cache_lock:
+                row = self._result_cache.execute(
+                    'SELECT payload FROM results WHERE path = ? AND url = ? AND mtime = ?',
+                    (str(json_file_path.resolve()), url, mtime)).fetchone()
+        except sqlite3.Error as e:
+            self.logger.debug(f"Result cache lookup failed for {url}: {e}")
+            return None
+        return _json_loads(row[0]) if row else None
+
+    def _store_result(self, json_file_path: Path, url: str, mtime: float, image_data: Dict[str, any]) -> None:
+        """Remember the image chosen for an input file so the next run can skip scraping it."""
+        if self._result_cache is None:
+            return
+        try:
+            with self._result_cache_lock:
+                self._result_cache.execute(
+                    'INSERT OR REPLACE INTO results (path, url, mtime, payload) VALUES (?, ?, ?, ?)',
+                    (str(json_file_path.resolve()), url, mtime, json.dumps(image_data)))
+        except sqlite3.Error as e:
+            self.logger.debug(f"Result cache write failed for {url}: {e}")
+
+    def _forget_result(self, json_file_path: Path) -> None:
+        """Drop an input file's cached pick, so the next run scrapes it again."""
+        if self._result_cache is None:
+            return
+        try:
+            with self._result_cache_lock:
+                self._result_cache.execute('DELETE FROM results WHERE path = ?', (str(json_file_path.resolve()),))
+        except sqlite3.Error as e:
+            self.logger.debug(f"Result cache delete failed for {json_file_path}: {e}")
+
+    def _create_session(self, cached: bool = True) -> requests.Session:
+        """Create a requests session with retry strategy and proper headers (cached for article pages)."""
+        if cached and requests_cache is not None and config.HTTP_CACHE:
+            # On-disk cache honouring Cache-Control/ETag so re-runs skip the network
+            session = requests_cache.CachedSession(
+                config.HTTP_CACHE,
+                backend='sqlite',
+                expire_after=config.HTTP_CACHE_EXPIRE,
+                allowable_methods=('GET', 'HEAD'),
+                cache_control=True,
+            )
+        else:
+            session = requests.Session()
         
         # Retry strategy
         retry_strategy = Retry(
-            total=3,
+            total=config.RETRY_ATTEMPTS,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'HEAD']),  # the only methods we send; both idempotent
+            respect_retry_after_header=True,  # 429/503 pauses as long as the server asks
+        )
+        # Keep connections to many hosts alive (article sites plus their image
+        # CDNs) so requests reuse them instead of paying DNS + TCP + TLS again;
+        # per-host connections are capped by the host slots anyway
+        adapter = HTTPAdapter(
+            pool_connections=config.POOL_HOSTS,
+            pool_maxsize=config.MAX_PER_HOST,
+            max_retries=retry_strategy,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         # Set user agent to avoid blocking
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        session.headers.update(config.DEFAULT_HEADERS)
         
         return session
 
+    @staticmethod
+    def _create_newspaper_config() -> NewspaperConfig:
+        """newspaper3k settings shared by every Article, matching our session's headers."""
+        newspaper_config = NewspaperConfig()
+        newspaper_config.browser_user_agent = config.USER_AGENT
+        newspaper_config.request_timeout = config.REQUEST_TIMEOUT
+        return newspaper_config
+
+    def _create_turbojpeg(self):
+        """Load the libjpeg-turbo encoder if PyTurboJPEG and the library are available."""
+        if TurboJPEG is None:
+            return None
+        try:
+            return TurboJPEG()
+        except Exception as e:
+            self.logger.debug(f"TurboJPEG unavailable, using Pillow for JPEG encoding: {e}")
+            return None
+
+    def _save_jpeg(self, img: Image.Image, output_path: Path) -> None:
+        """
+        Encode an RGB image as JPEG.
+        
+        Uses TurboJPEG when available; Pillow is used otherwise, or when the
+        extra Huffman optimization pass is enabled (TurboJPEG has no equivalent).
+        """
+        if self._turbojpeg is not None and not config.OPTIMIZE_JPG:
+            jpeg_bytes = self._turbojpeg.encode(np.asarray(img), quality=config.JPG_QUALITY,
+                                                pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420,
+                                                flags=TJFLAG_PROGRESSIVE if config.PROGRESSIVE_JPG else 0)
+            output_path.write_bytes(jpeg_bytes)
+        else:
+            img.save(output_path, 'JPEG', quality=config.JPG_QUALITY, optimize=config.OPTIMIZE_JPG,
+                     progressive=config.PROGRESSIVE_JPG)
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        """Hold one of the URL host's request slots and one of the global ones."""
+        host = _cached_urlparse(url).netloc.lower()
+        with self._host_semaphores_lock:
+            host_semaphore = self._host_semaphores[host]
+            failures = self._host_failures.get(host, 0)
+        # Stop sending requests to a host that keeps failing after retries
+        if config.HOST_FAILURE_LIMIT and failures >= config.HOST_FAILURE_LIMIT:
+            raise HostSkippedError(f"Skipping {host} after {failures} consecutive connection failures")
+        # Take the host slot first so a busy host never ties up a global slot
+        with host_semaphore:
+            if config.REQUEST_DELAY:
+                # Book this request's start time, spaced REQUEST_DELAY after the last one
+                with self._host_semaphores_lock:
+                    now = time.monotonic()
+                    start = max(now, self._host_next_request.get(host, now))
+                    self._host_next_request[host] = start + config.REQUEST_DELAY
+                if start > now:
+                    time.sleep(start - now)
+            with self._connection_slots:
+                try:
+                    yield
+                except (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError):
+                    with self._host_semaphores_lock:
+                        self._host_failures[host] += 1
+                        failures = self._host_failures[host]
+                    if failures == config.HOST_FAILURE_LIMIT:
+                        self.logger.warning(f"Giving up on {host} after {failures} consecutive connection failures")
+                    raise
+                else:
+                    if failures:
+                        with self._host_semaphores_lock:
+                            self._host_failures.pop(host, None)
+
     def sanitize_filename(self, filename: str) -> str:
         """
         Sanitize a string to be safe for use as a filename.
@@ -117,20 +575,48 @@ class ImageScraperPipeline:
             Sanitized filename safe for filesystem use
         """
         # Remove/replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        filename = _INVALID_FILENAME_RE.sub('_', filename)
         # Remove extra whitespace and limit length
-        filename = re.sub(r'\s+', ' ', filename.strip())[:100]
+        filename = _WHITESPACE_RE.sub(' ', filename.strip())[:100]
         # Remove leading/trailing dots and spaces
         filename = filename.strip('. ')
         
         return filename if filename else "unnamed_article"
 
-    def extract_images_trafilatura(self, url: str) -> List[Dict[str, any]]:
+    def _parse_page(self, html: bytes) -> Optional[lxml.html.HtmlElement]:
+        """Parse fetched page bytes, reusing this thread's tree if the same bytes were just parsed."""
+        page = self._parsed_page
+        if getattr(page, 'html', None) is not html:
+            page.tree = _parse_html(html)
+            page.html = html
+        return page.tree
+
+    def _fetch_html(self, url: str) -> Optional[bytes]:
+        """
+        Fetch the article page once so every extractor can parse the same bytes.
+        
+        Args:
+            url: Article URL to fetch
+            
+        Returns:
+            Raw HTML bytes, or None if the page could not be fetched
+        """
+        try:
+            with self._host_slot(url):
+                response = self.session.get(url, timeout=config.REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            self.logger.warning(f"Could not fetch {url}: {e}")
+            return None
+
+    def extract_images_trafilatura(self, url: str, html: Optional[bytes] = None) -> List[Dict[str, any]]:
         """
         Extract images using trafilatura (primary method).
         
         Args:
             url: Article URL to scrape
+            html: Already fetched page HTML; downloaded here if not given
             
         Returns:
             List of image dictionaries with URL and score
@@ -139,12 +625,17 @@ class ImageScraperPipeline:
             self.logger.info(f"Trying trafilatura for {url}")
             
             # Download the webpage
-            downloaded = trafilatura.fetch_url(url)
+            downloaded = html
+            if downloaded is None:
+                with self._host_slot(url):
+                    downloaded = trafilatura.fetch_url(url)
             if not downloaded:
                 return []
             
             # Extract metadata which includes main image
-            metadata = trafilatura.metadata.extract_metadata(downloaded)
+            metadata = trafilatura.metadata.extract_metadata(
+                downloaded, default_url=url, date_config=dict(TRAFILATURA_DATE_CONFIG)
+            )
             images = []
             
             if metadata and hasattr(metadata, 'image') and metadata.image:
@@ -158,11 +649,11 @@ class ImageScraperPipeline:
                 self.logger.info(f"Trafilatura found main image: {metadata.image} (score: {score})")
             
             # Also try to extract content and look for images in it
-            content = trafilatura.extract(downloaded, include_images=True, include_links=True)
+            content = trafilatura.extract(downloaded, url=url, include_images=True, include_links=True)
             if content:
                 # Parse content for additional images
-                soup = BeautifulSoup(content, 'html.parser')
-                img_tags = soup.find_all('img')
+                tree = _parse_html(content)
+                img_tags = _IMG_XPATH(tree) if tree is not None else []
                 seen_urls = {img['url'] for img in images}
                 
                 for img in img_tags:
@@ -184,12 +675,13 @@ class ImageScraperPipeline:
             self.logger.warning(f"Trafilatura failed for {url}: {e}")
             return []
 
-    def extract_images_newspaper(self, url: str) -> List[Dict[str, any]]:
+    def extract_images_newspaper(self, url: str, html: Optional[bytes] = None) -> List[Dict[str, any]]:
         """
         Extract images using newspaper3k (secondary method).
         
         Args:
             url: Article URL to scrape
+            html: Already fetched page HTML; downloaded here if not given
             
         Returns:
             List of image dictionaries with URL and score
@@ -197,8 +689,14 @@ class ImageScraperPipeline:
         try:
             self.logger.info(f"Trying newspaper3k for {url}")
             
-            article = Article(url)
-            article.download()
+            # The page normally comes from the shared (cached) session fetch;
+            # newspaper3k only downloads it itself if that failed
+            article = Article(url, config=self._newspaper_config)
+            if html is not None:
+                article.download(input_html=html)
+            else:
+                with self._host_slot(url):
+                    article.download()
             article.parse()
             
             images = []
@@ -235,12 +733,12 @@ class ImageScraperPipeline:
             self.logger.warning(f"Newspaper3k failed for {url}: {e}")
             return []
 
-    def extract_opengraph_images(self, soup: BeautifulSoup, url: str) -> List[Dict[str, any]]:
+    def extract_opengraph_images(self, tree: lxml.html.HtmlElement, url: str) -> List[Dict[str, any]]:
         """
         Extract images from OpenGraph and other meta tags.
         
         Args:
-            soup: BeautifulSoup object of the webpage
+            tree: Parsed lxml document of the webpage
             url: Base URL for resolving relative URLs
             
         Returns:
@@ -249,9 +747,9 @@ class ImageScraperPipeline:
         images = []
         
         # OpenGraph image
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            img_url = urljoin(url, og_image['content'])
+        og_image = _OG_IMAGE_XPATH(tree)
+        if og_image and og_image[0]:
+            img_url = urljoin(url, og_image[0])
             if not self._should_exclude_image_url(img_url):
                 score = self.score_image_relevance(img_url, source_method="opengraph")
                 images.append({
@@ -261,9 +759,9 @@ class ImageScraperPipeline:
                 })
         
         # Twitter card image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-        if twitter_image and twitter_image.get('content'):
-            img_url = urljoin(url, twitter_image['content'])
+        twitter_image = _TWITTER_IMAGE_XPATH(tree)
+        if twitter_image and twitter_image[0]:
+            img_url = urljoin(url, twitter_image[0])
             if not self._should_exclude_image_url(img_url):
                 score = self.score_image_relevance(img_url, source_method="twitter_card")
                 images.append({
@@ -274,10 +772,10 @@ class ImageScraperPipeline:
         
         # Schema.org structured data
         try:
-            scripts = soup.find_all('script', type='application/ld+json')
+            scripts = _JSON_LD_XPATH(tree)
             for script in scripts:
                 try:
-                    data = json.loads(script.string)
+                    data = _json_loads(script.text)
                     if isinstance(data, dict):
                         # Look for image in various schema types
                         schema_image = data.get('image')
@@ -302,33 +800,66 @@ class ImageScraperPipeline:
         
         return images
 
-    def extract_images_beautifulsoup(self, url: str) -> List[Dict[str, any]]:
+    def extract_images_opengraph_only(self, url: str, html: Optional[bytes] = None) -> List[Dict[str, any]]:
+        """
+        Extract only the OpenGraph, Twitter card and Schema.org images.
+        
+        Only the meta/JSON-LD lookups run, so this is a cheap check before
+        paying for newspaper3k or the full img-tag scan.
+        
+        Args:
+            url: Article URL to scrape
+            html: Already fetched page HTML
+            
+        Returns:
+            List of image dictionaries from meta tags
+        """
+        if not html:
+            return []
+        
+        try:
+            self.logger.info(f"Trying meta tags for {url}")
+            tree = self._parse_page(html)
+            if tree is None:
+                return []
+            return self.extract_opengraph_images(tree, url)
+        except Exception as e:
+            self.logger.warning(f"Meta tag extraction failed for {url}: {e}")
+            return []
+
+    def extract_images_beautifulsoup(self, url: str, html: Optional[bytes] = None) -> List[Dict[str, any]]:
         """
-        Extract images using BeautifulSoup with filtering (fallback method).
+        Extract images by scanning the page's tags with lxml (fallback method).
         
         Args:
             url: Article URL to scrape
+            html: Already fetched page HTML; downloaded here if not given
             
         Returns:
             List of image dictionaries with URL and score
         """
         try:
-            self.logger.info(f"Trying BeautifulSoup for {url}")
+            self.logger.info(f"Trying HTML tag scan for {url}")
             
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            if html is None:
+                with self._host_slot(url):
+                    response = self.session.get(url, timeout=config.REQUEST_TIMEOUT)
+                response.raise_for_status()
+                html = response.content
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_page(html)
+            if tree is None:
+                return []
             images = []
             seen_urls = set()
             
             # First, try OpenGraph and meta tags (highest priority)
-            meta_images = self.extract_opengraph_images(soup, url)
+            meta_images = self.extract_opengraph_images(tree, url)
             images.extend(meta_images)
             seen_urls.update(img['url'] for img in meta_images)
             
-            # Find all img tags
-            img_tags = soup.find_all('img')
+            # Find all img tags that carry a source
+            img_tags = _IMG_XPATH(tree)
             
             for img in img_tags:
                 src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
@@ -353,36 +884,61 @@ class ImageScraperPipeline:
                     seen_urls.add(full_url)
             
             # Also check for picture/source elements
-            picture_tags = soup.find_all('picture')
-            for picture in picture_tags:
-                sources = picture.find_all('source')
-                for source in sources:
-                    srcset = source.get('srcset')
-                    if srcset:
-                        # Extract first URL from srcset
-                        url_part = srcset.split(',')[0].strip().split(' ')[0]
-                        full_url = urljoin(url, url_part)
-                        if not self._should_exclude_image_url(full_url) and full_url not in seen_urls:
-                            score = self.score_image_relevance(full_url, source_method="soup")
-                            images.append({
-                                'url': full_url,
-                                'score': score,
-                                'source': 'soup'
-                            })
-                            seen_urls.add(full_url)
+            for srcset in _PICTURE_SRCSET_XPATH(tree):
+                if srcset:
+                    # Extract first URL from srcset
+                    url_part = srcset.split(',')[0].strip().split(' ')[0]
+                    full_url = urljoin(url, url_part)
+                    if not self._should_exclude_image_url(full_url) and full_url not in seen_urls:
+                        score = self.score_image_relevance(full_url, source_method="soup")
+                        images.append({
+                            'url': full_url,
+                            'score': score,
+                            'source': 'soup'
+                        })
+                        seen_urls.add(full_url)
             
             return images
             
         except Exception as e:
-            self.logger.warning(f"BeautifulSoup failed for {url}: {e}")
+            self.logger.warning(f"HTML tag scan failed for {url}: {e}")
             return []
 
+    def _build_exclude_db(self):
+        """Compile the exclude patterns into one Hyperscan database, if available."""
+        if hyperscan is None:
+            return None
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in self.exclude_patterns],
+            ids=list(range(len(self.exclude_patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.exclude_patterns),
+        )
+        return db
+
+    def _matches_exclude(self, text: str) -> bool:
+        """Return True if any logo or exclude pattern matches the text."""
+        if config.is_logo_url(text):
+            return True
+        if self._exclude_db is None:
+            return self.exclude_regex.search(text) is not None
+        
+        scratch = getattr(self._exclude_scratch, 'scratch', None)
+        if scratch is None:
+            scratch = self._exclude_scratch.scratch = hyperscan.Scratch(self._exclude_db)
+        try:
+            # Stop at the first match; the scan raises ScanTerminated then
+            self._exclude_db.scan(text.encode(), match_event_handler=lambda *_: True, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
     def _should_exclude_image(self, img_tag, img_url: str) -> bool:
         """
         Determine if an image should be excluded based on various criteria.
         
         Args:
-            img_tag: BeautifulSoup img tag element
+            img_tag: lxml img element
             img_url: Full image URL
             
         Returns:
@@ -394,12 +950,12 @@ class ImageScraperPipeline:
         
         # Check alt text
         alt_text = img_tag.get('alt', '').lower()
-        if self.exclude_regex.search(alt_text):
+        if self._matches_exclude(alt_text):
             return True
         
         # Check class names
-        class_names = ' '.join(img_tag.get('class', [])).lower()
-        if self.exclude_regex.search(class_names):
+        class_names = _class_string(img_tag).lower()
+        if self._matches_exclude(class_names):
             return True
         
         # Check dimensions if available
@@ -408,7 +964,7 @@ class ImageScraperPipeline:
         if width and height:
             try:
                 w, h = int(width), int(height)
-                if w < self.min_image_size[0] or h < self.min_image_size[1]:
+                if w < config.MIN_W or h < config.MIN_H:
                     return True
             except ValueError:
                 pass
@@ -418,53 +974,35 @@ class ImageScraperPipeline:
     def _should_exclude_image_url(self, img_url: str) -> bool:
         """Check if image URL should be excluded based on patterns."""
         # Basic pattern matching
-        if self.exclude_regex.search(img_url):
+        if self._matches_exclude(img_url):
             return True
         
         # Additional checks for tracking pixels and non-image URLs
-        parsed_url = urlparse(img_url)
+        parsed_url = _cached_urlparse(img_url)
         
-        # Exclude tracking domains and specific tracking URLs
-        tracking_domains = [
-            'facebook.com', 'google-analytics.com', 'googletagmanager.com',
-            'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
-            'outbrain.com', 'taboola.com', 'amazon-adsystem.com'
-        ]
-        
-        # Specific tracking URL patterns
-        tracking_patterns = [
-            'facebook.com/tr', 'google-analytics.com', '/pixel?', '/track?',
-            '/beacon?', '/analytics?', 'googletagmanager.com'
-        ]
-        
-        # Check for tracking domains
-        if any(domain in parsed_url.netloc.lower() for domain in tracking_domains):
-            return True
-            
-        # Check for specific tracking URL patterns
-        if any(pattern in img_url.lower() for pattern in tracking_patterns):
+        # Exclude tracking domains and specific tracking URLs in one scan
+        if config.is_tracking_url(img_url):
             return True
         
         # Exclude URLs with tracking parameters
-        if any(param in parsed_url.query.lower() for param in ['fbclid', 'gclid', 'utm_', 'pixel']):
+        if self._tracking_param_re.search(parsed_url.query.lower()):
             return True
         
         # Exclude very small images (likely pixels)
-        if 'width=1' in img_url or 'height=1' in img_url or '1x1' in img_url:
+        if self._pixel_size_re.search(img_url):
             return True
         
         # Must have valid image extension or be from a known image CDN
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.svg'}
         path_ext = Path(parsed_url.path).suffix.lower()
         
         # Allow images from known CDNs even without extensions
-        image_cdns = ['static.toiimg.com', 'images.', 'img.', 'cdn.', 'assets.']
-        is_image_cdn = any(cdn in parsed_url.netloc.lower() for cdn in image_cdns)
+        is_image_cdn = (parsed_url.hostname in self._image_cdn_hosts
+                        or self._image_cdn_re.search(parsed_url.netloc.lower()) is not None)
         
         if not path_ext and not is_image_cdn:
             return True
         
-        if path_ext and path_ext not in valid_extensions:
+        if path_ext and path_ext not in config.ALLOWED_EXTENSIONS:
             return True
         
         return False
@@ -474,53 +1012,44 @@ class ImageScraperPipeline:
         Analyze the HTML context around an image to determine relevance.
         
         Args:
-            img_tag: BeautifulSoup img tag
+            img_tag: lxml img element
             article_content: Article text content for comparison
             
         Returns:
             Context relevance score (0-30)
         """
-        if not img_tag:
+        if img_tag is None:
             return 0
         
         context_score = 0
         
         # Check if image is within article content areas
-        parent = img_tag.parent
+        parent = img_tag.getparent()
         for _ in range(3):  # Check up to 3 levels up
-            if parent:
-                parent_classes = ' '.join(parent.get('class', [])).lower()
+            if parent is not None:
+                parent_classes = _class_string(parent).lower()
                 parent_id = parent.get('id', '').lower()
                 
                 # Positive indicators
-                if any(indicator in parent_classes + parent_id for indicator in [
-                    'article', 'content', 'story', 'body', 'post', 'main', 'entry'
-                ]):
+                if self._context_positive_re.search(parent_classes + parent_id):
                     context_score += 15
                     break
                 
                 # Negative indicators
-                if any(indicator in parent_classes + parent_id for indicator in [
-                    'header', 'nav', 'footer', 'sidebar', 'menu', 'ad', 'widget'
-                ]):
+                if self._context_negative_re.search(parent_classes + parent_id):
                     context_score -= 10
                     break
                 
-                parent = parent.parent
+                parent = parent.getparent()
         
         # Check surrounding text for relevance
         try:
-            # Get text around the image
-            surrounding_text = ""
-            if img_tag.parent:
-                surrounding_text = img_tag.parent.get_text().lower()
-            
             # Look for caption or figure elements
-            figure_parent = img_tag.find_parent(['figure', 'div'])
-            if figure_parent:
-                caption = figure_parent.find(['figcaption', 'caption', 'div'])
-                if caption:
-                    caption_text = caption.get_text().lower()
+            figure_parent = next(img_tag.iterancestors('figure', 'div'), None)
+            if figure_parent is not None:
+                caption = next(figure_parent.iterdescendants('figcaption', 'caption', 'div'), None)
+                if caption is not None:
+                    caption_text = ''.join(_VISIBLE_TEXT_XPATH(caption)).lower()
                     if len(caption_text) > 10:  # Substantial caption
                         context_score += 10
         except:
@@ -528,6 +1057,30 @@ class ImageScraperPipeline:
         
         return max(0, context_score)
 
+    def _build_score_automaton(self):
+        """Build one Aho-Corasick automaton over every URL scoring keyword, if available."""
+        if ahocorasick is None:
+            return None
+        groups_by_term = defaultdict(set)
+        for group, (terms, _) in enumerate(self._url_score_groups):
+            for term in terms:
+                groups_by_term[term].add(group)
+        automaton = ahocorasick.Automaton()
+        for term, groups in groups_by_term.items():
+            automaton.add_word(term, tuple(groups))
+        automaton.make_automaton()
+        return automaton
+
+    def _url_keyword_score(self, url_lower: str) -> int:
+        """Sum the weights of the keyword groups found in a URL (each group counts once)."""
+        if self._url_score_ac is not None:
+            # Single pass over the URL for every keyword of every group
+            hit = set()
+            for _, groups in self._url_score_ac.iter(url_lower):
+                hit.update(groups)
+            return sum(self._url_score_groups[group][1] for group in hit)
+        return sum(weight for pattern, weight in self._url_score_rules if pattern.search(url_lower))
+
     def score_image_relevance(self, img_url: str, img_tag=None, source_method: str = "", article_content: str = "") -> int:
         """
         Score image relevance based on various factors.
@@ -535,7 +1088,7 @@ class ImageScraperPipeline:
         
         Args:
             img_url: Image URL to score
-            img_tag: BeautifulSoup img tag (if available)
+            img_tag: lxml img element (if available)
             source_method: Method that found this image (trafilatura, newspaper, soup)
             
         Returns:
@@ -544,109 +1097,61 @@ class ImageScraperPipeline:
         score = 50  # Base score
         
         # Source method scoring (prioritize trafilatura and newspaper main images)
-        if source_method == "trafilatura_main":
-            score += 30  # Highest priority for main article image
-        elif source_method == "newspaper_top":
-            score += 25  # High priority for newspaper top image
-        elif source_method == "trafilatura":
-            score += 15
-        elif source_method == "newspaper":
-            score += 10
-        elif source_method == "soup":
-            score += 5
+        score += _SOURCE_METHOD_SCORES.get(source_method, 0)
         
         # URL-based scoring with improved logo detection
         url_lower = img_url.lower()
-        parsed_url = urlparse(img_url)
-        
-        # Positive indicators in URL
-        if any(term in url_lower for term in ['featured', 'main', 'hero', 'cover', 'article']):
-            score += 20
-        if any(term in url_lower for term in ['large', 'big', 'full', 'original']):
-            score += 12
-        if 'wp-content/uploads' in url_lower:  # WordPress uploads (often article images)
-            score += 10
-        
-        # Check for content-specific URLs (not logos)
-        if any(term in url_lower for term in ['photo', 'image', 'pic', 'img']):
-            score += 8
-        
-        # Strong negative indicators for logos and branding
-        logo_indicators = [
-            'logo', 'brand', 'header', 'masthead', 'watermark',
-            'signature', 'emblem', 'badge', 'seal', 'mark'
-        ]
-        if any(term in url_lower for term in logo_indicators):
-            score -= 25  # Heavy penalty for logos
-        
-        # Company/site branding detection
-        if any(term in url_lower for term in ['toi', 'timesofindia', 'company', 'corp']):
-            score -= 15
-        
-        # Tracking pixels and analytics (should never be selected as images)
-        if 'facebook.com/tr' in url_lower or '/tr?' in url_lower:
-            score -= 50  # Massive penalty for Facebook tracking pixels
-        if any(pattern in url_lower for pattern in ['analytics', 'tracking', 'pixel?', 'beacon?']):
-            score -= 40
-        
-        # Standard negative indicators
-        if any(term in url_lower for term in ['thumb', 'small', 'mini', 'icon']):
-            score -= 15
-        if any(term in url_lower for term in ['ad', 'banner', 'widget', 'sidebar']):
-            score -= 20
-        if any(term in url_lower for term in ['social', 'share', 'profile', 'avatar']):
-            score -= 10
-        
-        # Size indicators in URL (logos often have standard sizes)
-        if any(size in url_lower for size in ['150x', '200x', '100x', '50x']):
-            score -= 12  # Common logo sizes
-        if any(size in url_lower for size in ['x150', 'x200', 'x100', 'x50']):
-            score -= 12
+        
+        score += self._url_keyword_score(url_lower)
         
         # HTML tag-based scoring (if available)
-        if img_tag:
+        if img_tag is not None:
             # Check alt text for relevance
             alt_text = img_tag.get('alt', '').lower()
             if alt_text:
-                if any(term in alt_text for term in ['article', 'story', 'news', 'main', 'photo']):
+                if self._alt_positive_re.search(alt_text):
                     score += 10
-                if any(term in alt_text for term in ['logo', 'icon', 'button', 'arrow']):
+                if self._alt_negative_re.search(alt_text):
                     score -= 15
             
             # Check CSS classes
-            classes = ' '.join(img_tag.get('class', [])).lower()
-            if 'featured' in classes or 'hero' in classes or 'main' in classes:
+            classes = _class_string(img_tag).lower()
+            if self._class_positive_re.search(classes):
                 score += 15
-            if any(term in classes for term in ['sidebar', 'widget', 'ad', 'banner']):
+            if self._class_negative_re.search(classes):
                 score -= 20
             
             # Check parent elements for context
-            parent = img_tag.parent
-            if parent:
-                parent_classes = ' '.join(parent.get('class', [])).lower()
+            parent = img_tag.getparent()
+            if parent is not None:
+                parent_classes = _class_string(parent).lower()
                 if 'article' in parent_classes or 'content' in parent_classes:
                     score += 10
                 if 'sidebar' in parent_classes or 'footer' in parent_classes:
                     score -= 15
         
         # Add context analysis score
-        if img_tag:
+        if img_tag is not None:
             context_score = self.analyze_image_context(img_tag, article_content)
             score += context_score
         
         # File extension preferences (some formats are more likely to be main images)
-        if img_url.lower().endswith(('.jpg', '.jpeg')):
+        if url_lower.endswith(('.jpg', '.jpeg')):
             score += 5  # JPEG often used for photos
-        elif img_url.lower().endswith('.png'):
+        elif url_lower.endswith('.png'):
             score += 2  # PNG could be graphics or photos
-        elif img_url.lower().endswith('.gif'):
+        elif url_lower.endswith('.gif'):
             score -= 5  # GIFs often animations or small graphics
         
         return max(0, min(100, score))  # Clamp between 0-100
 
     def validate_image_size(self, img_url: str) -> bool:
         """
-        Validate image size using HEAD request and optionally PIL.
+        Validate image size and dimensions (see _probe_image_size).
+        
+        Probe answers are memoized for the run; network failures are not, so
+        the URL is probed again the next time it comes up. An image on a
+        skipped host counts as invalid, since it could not be downloaded.
         
         Args:
             img_url: Image URL to validate
@@ -655,46 +1160,131 @@ class ImageScraperPipeline:
             True if image meets size requirements
         """
         try:
-            # Check file size with HEAD request
-            head_response = self.session.head(img_url, timeout=10)
-            content_length = head_response.headers.get('content-length')
-            
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > self.max_file_size_mb:
-                    self.logger.info(f"Image too large ({size_mb:.1f}MB): {img_url}")
-                    return False
-            
-            # Download a small portion to check actual dimensions
-            response = self.session.get(img_url, timeout=15, stream=True)
-            response.raise_for_status()
+            return self._probe_image_size(img_url)
+        except HostSkippedError as e:
+            self.logger.info(f"Image rejected, {e}: {img_url}")
+            return False
+        except requests.RequestException as e:
+            self.logger.warning(f"Could not validate image size for {img_url}: {e}")
+            return True  # Assume valid if we can't check
+
+    def _probe_image_size(self, img_url: str) -> bool:
+        """
+        Validate image size from a small ranged GET.
+        
+        Only the first 4KB are requested and the dimensions are parsed from the
+        image header directly; the total file size comes from the Content-Range
+        header (or Content-Length if the server ignores ranges). If the header
+        lies beyond the prefix (e.g. a JPEG with a large EXIF block), the image
+        is streamed only until its dimensions are known.
+        
+        Args:
+            img_url: Image URL to validate
             
-            # Read enough bytes to determine image dimensions
-            chunk_size = 1024
-            data = b''
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data += chunk
-                if len(data) > chunk_size * 10:  # Stop after 10KB
-                    break
+        Returns:
+            True if image meets size requirements
             
-            try:
-                img = Image.open(io.BytesIO(data))
-                width, height = img.size
-                
-                if width < self.min_image_size[0] or height < self.min_image_size[1]:
-                    self.logger.info(f"Image too small ({width}x{height}): {img_url}")
-                    return False
-                
-                return True
+        Raises:
+            requests.RequestException: on connection errors, timeouts and
+            exhausted retries, so that the result is not memoized
+        """
+        try:
+            with self._host_slot(img_url):
+                response = self._image_session.get(img_url, headers={'Range': f'bytes=0-{HEADER_PROBE_BYTES - 1}'},
+                                                   timeout=config.PROBE_TIMEOUT, stream=True)
+                try:
+                    response.raise_for_status()
+                    
+                    # Check file size from the range/length headers
+                    total_size = None
+                    content_range = response.headers.get('content-range', '')
+                    if response.status_code == 206 and content_range.rpartition('/')[2].isdigit():
+                        total_size = int(content_range.rpartition('/')[2])
+                    elif response.headers.get('content-length'):
+                        total_size = int(response.headers['content-length'])
+                    
+                    if total_size and total_size > config.MAX_FILE_SIZE_BYTES:
+                        size_mb = total_size / (1024 * 1024)
+                        self.logger.info(f"Image too large ({size_mb:.1f}MB): {img_url}")
+                        return False
+                    
+                    data = bytearray()
+                    size = self._read_image_size(response, data)
+                    partial = response.status_code == 206
+                finally:
+                    response.close()
                 
-            except Exception:
-                # If we can't determine size, assume it's valid
-                return True
+                # A JPEG's frame header can sit past the prefix (after EXIF/ICC
+                # segments): read on until it is. Other formats fall to PIL below.
+                # Only the rest of the file (up to the size cap) is requested and
+                # appended to the prefix already in hand.
+                if size is None and partial and data[:3] == b'\xff\xd8\xff':
+                    response = self._image_session.get(
+                        img_url, headers={'Range': f'bytes={len(data)}-{config.MAX_FILE_SIZE_BYTES - 1}'},
+                        timeout=config.PROBE_TIMEOUT, stream=True)
+                    try:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            data = bytearray()  # range ignored this time: body starts at byte 0
+                        size = self._read_image_size(response, data)
+                    finally:
+                        response.close()
+            
+            if size is None:
+                # Formats the header parser doesn't know (TIFF, ICO, ...)
+                try:
+                    size = Image.open(io.BytesIO(data), formats=_image_formats(data)).size
+                except Exception:
+                    # If we can't determine size, assume it's valid
+                    return True
+            
+            width, height = size
+            if width < config.MIN_W or height < config.MIN_H:
+                self.logger.info(f"Image too small ({width}x{height}): {img_url}")
+                return False
+            
+            return True
             
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError):
+            raise
         except Exception as e:
             self.logger.warning(f"Could not validate image size for {img_url}: {e}")
             return True  # Assume valid if we can't check
 
+    @staticmethod
+    def _read_image_size(response: requests.Response, data: bytearray) -> Optional[Tuple[int, int]]:
+        """
+        Read a streamed response into `data` until the image dimensions can be parsed.
+        
+        Only JPEGs are read past the first HEADER_PROBE_BYTES; every other
+        format either has its size near the start or isn't parsed here at all.
+        """
+        for chunk in response.iter_content(chunk_size=HEADER_PROBE_BYTES):
+            data.extend(chunk)
+            size = _image_dimensions(data)
+            if size is not None:
+                return size
+            if len(data) >= HEADER_PROBE_BYTES and data[:3] != b'\xff\xd8\xff':
+                break
+            if len(data) > config.MAX_FILE_SIZE_BYTES:
+                break
+        return None
+
+    @staticmethod
+    def _has_alpha(img: Image.Image) -> bool:
+        """
+        Check whether an image has any actually transparent pixels.
+        
+        Fully opaque RGBA/LA images and palette images without a
+        transparency entry can be converted straight to RGB, skipping the
+        white-background paste.
+        """
+        if img.mode == 'P':
+            return 'transparency' in img.info
+        if img.mode in ('RGBA', 'LA'):
+            return img.getextrema()[-1][0] < 255
+        return False
+
     def download_image(self, img_url: str, output_path: Path) -> bool:
         """
         Download an image from URL and convert it to JPG format.
@@ -707,30 +1297,49 @@ class ImageScraperPipeline:
             True if download and conversion was successful
         """
         try:
-            response = self.session.get(img_url, timeout=30)
-            response.raise_for_status()
+            # Stream the body so oversized images are abandoned mid-transfer
+            with self._host_slot(img_url):
+                response = self._image_session.get(img_url, timeout=config.REQUEST_TIMEOUT, stream=True)
+                try:
+                    response.raise_for_status()
+                    data = bytearray()
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        data.extend(chunk)
+                        if len(data) > config.MAX_FILE_SIZE_BYTES:
+                            raise ValueError(f"image exceeds {config.MAX_FILE_SIZE_MB}MB limit")
+                finally:
+                    response.close()
             
             # Always save as JPG
             output_path = output_path.with_suffix('.jpg')
             
             # Load image data into PIL
-            image_data = io.BytesIO(response.content)
+            image_data = io.BytesIO(data)
             
             # Open and process the image
-            with Image.open(image_data) as img:
+            with Image.open(image_data, formats=_image_formats(data)) as img:
+                max_dim = config.MAX_IMAGE_DIMENSION
+                if max_dim:
+                    # JPEGs can be decoded straight at a reduced scale (no-op for other formats)
+                    img.draft('RGB', (max_dim, max_dim))
+                
                 # Convert to RGB if necessary (for PNG with transparency, WEBP, etc.)
-                if img.mode in ('RGBA', 'LA', 'P'):
+                if self._has_alpha(img):
                     # Create white background for transparent images
                     rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
+                    if img.mode != 'RGBA':
                         img = img.convert('RGBA')
-                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                    rgb_img.paste(img, mask=img.split()[-1])
                     img = rgb_img
                 elif img.mode != 'RGB':
                     img = img.convert('RGB')
                 
+                # Downscale oversized images; saving without exif= drops the metadata
+                if max_dim and max(img.size) > max_dim:
+                    img.thumbnail((max_dim, max_dim), Image.LANCZOS)
+                
                 # Save as high-quality JPG
-                img.save(output_path, 'JPEG', quality=90, optimize=True)
+                self._save_jpeg(img, output_path)
             
             self.logger.info(f"Downloaded and converted to JPG: {output_path.name}")
             return True
@@ -749,57 +1358,104 @@ class ImageScraperPipeline:
         Returns:
             Dictionary with the best image data, or None if no suitable image found
         """
-        all_images = []
-        
-        # Method 1: Trafilatura (prioritize main images)
-        images = self.extract_images_trafilatura(url)
-        all_images.extend(images)
+        # Candidates are kept as parallel url/score/source lists, deduplicated
+        # by URL as they arrive (a repeated URL keeps its highest score)
+        index = {}
+        urls = []
+        scores = []
+        sources = []
+        rejected = set()  # URLs the early-accept probe already found invalid
+        best_score = 0
+        extractors = {
+            'trafilatura': self.extract_images_trafilatura,
+            'opengraph': self.extract_images_opengraph_only,
+            'newspaper': self.extract_images_newspaper,
+            'beautifulsoup': self.extract_images_beautifulsoup,
+        }
         
-        # Method 2: Newspaper3k (if no high-quality image found yet)
-        best_score = max([img['score'] for img in all_images], default=0)
-        if best_score < 80:  # Raised threshold for better quality
-            images = self.extract_images_newspaper(url)
-            all_images.extend(images)
+        # Fetch the page once and let every extractor parse the same bytes. A
+        # failed fetch (already retried by the session) holds for the whole
+        # ladder too, rather than each extractor requesting the page again.
+        html = self._fetch_html(url)
+        if html is None:
+            self.logger.warning(f"No images found for {url}: page could not be fetched")
+            return None
         
-        # Method 3: BeautifulSoup with meta tags (only if still no good image)
-        best_score = max([img['score'] for img in all_images], default=0)
-        if best_score < 70:  # Raised threshold
-            images = self.extract_images_beautifulsoup(url)
-            all_images.extend(images)
+        # Walk the fallback chain, stopping as soon as a method's threshold is met
+        for method, threshold in config.EXTRACTION_LADDER:
+            images = extractors[method](url, html)
+            
+            # A strong, valid candidate ends extraction right away
+            best = max(images, key=lambda img: img['score'], default=None)
+            if best and best['score'] >= config.ACCEPT_SCORE and best['url'] not in rejected:
+                if self.validate_image_size(best['url']):
+                    self.logger.info(f"Selected best image: {best['url']} (score: {best['score']}, source: {best['source']})")
+                    return best
+                rejected.add(best['url'])
+            
+            for img in images:
+                img_url = img['url']
+                score = img['score']
+                if score > best_score:
+                    best_score = score
+                i = index.get(img_url)
+                if i is None:
+                    index[img_url] = len(urls)
+                    urls.append(img_url)
+                    scores.append(score)
+                    sources.append(img['source'])
+                elif score > scores[i]:
+                    scores[i] = score
+                    sources[i] = img['source']
+            
+            if best_score >= threshold:
+                break
         
-        if not all_images:
+        if not urls:
             self.logger.warning(f"No images found for {url}")
             return None
         
-        # Remove duplicates while preserving highest score
-        seen_urls = {}
-        for img in all_images:
-            img_url = img['url']
-            if img_url not in seen_urls or img['score'] > seen_urls[img_url]['score']:
-                seen_urls[img_url] = img
-        
-        unique_images = list(seen_urls.values())
-        
-        # Sort by relevance score (highest first) and get the best one
-        unique_images.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Find the first image that passes size validation and minimum score
-        MIN_ACCEPTABLE_SCORE = 40  # Minimum score to accept an image
-        
-        for img_data in unique_images:
-            if img_data['score'] >= MIN_ACCEPTABLE_SCORE and self.validate_image_size(img_data['url']):
-                self.logger.info(f"Selected best image: {img_data['url']} (score: {img_data['score']}, source: {img_data['source']})")
-                return img_data
+        # Find the first image that passes size validation and minimum score.
+        # Acceptable candidates go into a heap keyed on (-score, index) and are
+        # popped one batch at a time, so the usual case (a hit in the first
+        # batch) never sorts the rest. Each batch is validated concurrently and
+        # read back in score order, matching a sequential scan of a stable sort.
+        heap = [(-scores[i], i) for i in range(len(urls))
+                if scores[i] >= config.MIN_ACCEPTABLE_SCORE and urls[i] not in rejected]
+        heapq.heapify(heap)
+        batch_size = config.VALIDATION_WORKERS
+        while heap:
+            batch = [heapq.heappop(heap)[1] for _ in range(min(batch_size, len(heap)))]
+            results = self._validation_pool.map(self.validate_image_size, [urls[i] for i in batch])
+            for i, is_valid in zip(batch, results):
+                if is_valid:
+                    self.logger.info(f"Selected best image: {urls[i]} (score: {scores[i]}, source: {sources[i]})")
+                    return {'url': urls[i], 'score': scores[i], 'source': sources[i]}
         
         # If no image meets minimum score, log the best available score
-        if unique_images:
-            best_score = unique_images[0]['score']
-            self.logger.warning(f"No images above minimum score ({MIN_ACCEPTABLE_SCORE}) for {url}. Best score: {best_score}")
-        else:
-            self.logger.warning(f"No valid images found after size validation for {url}")
+        self.logger.warning(f"No images above minimum score ({config.MIN_ACCEPTABLE_SCORE}) for {url}. Best score: {best_score}")
         
         return None
 
+    def _find_best_image(self, url: str) -> Optional[Dict[str, any]]:
+        """
+        scrape_article_images, memoized per article URL for the run.
+        
+        Only found images are remembered: a None can come from a transient
+        fetch failure or a skipped host, so the next file with the same URL
+        tries again. The oldest entry is evicted beyond 4096 URLs.
+        """
+        with self._best_images_lock:
+            best_image_data = self._best_images.get(url)
+        if best_image_data is None:
+            best_image_data = self.scrape_article_images(url)
+            if best_image_data is not None:
+                with self._best_images_lock:
+                    if len(self._best_images) >= 4096:
+                        del self._best_images[next(iter(self._best_images))]
+                    self._best_images[url] = best_image_data
+        return best_image_data
+
     def process_article(self, json_file_path: Path) -> bool:
         """
         Process a single JSON article file.
@@ -810,10 +1466,20 @@ class ImageScraperPipeline:
         Returns:
             True if processing was successful
         """
+        job = self._scrape_article(json_file_path)
+        return job is not None and self._save_article(job)
+
+    def _scrape_article(self, json_file_path: Path) -> Optional[Tuple[Path, Dict, str, Path, Optional[Dict], float]]:
+        """
+        Load an article JSON file and pick its best image (network-bound first half).
+        
+        Returns:
+            Tuple of (json_file_path, article_data, title, article_folder,
+            best_image_data, mtime) for _save_article, or None if processing failed
+        """
         try:
             # Load JSON data
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                article_data = json.load(f)
+            article_data = _read_json(json_file_path)
             
             # Extract required fields
             title = article_data.get('title', 'Untitled')
@@ -821,7 +1487,7 @@ class ImageScraperPipeline:
             
             if not url:
                 self.logger.error(f"No URL found in {json_file_path}")
-                return False
+                return None
             
             self.logger.info(f"Processing: {title}")
             
@@ -830,9 +1496,32 @@ class ImageScraperPipeline:
             article_folder = self.output_folder / folder_name
             article_folder.mkdir(exist_ok=True)
             
-            # Scrape the best image
-            best_image_data = self.scrape_article_images(url)
+            # Reuse the previous run's pick unless the JSON file has changed
+            mtime = json_file_path.stat().st_mtime
+            best_image_data = self._cached_result(json_file_path, url, mtime)
+            if best_image_data is not None:
+                self.logger.info(f"Using cached image for {url}: {best_image_data['url']}")
+            else:
+                # Scrape the best image
+                best_image_data = self._find_best_image(url)
+            if best_image_data is not None:
+                with self._source_wins_lock:
+                    self.source_wins[best_image_data['source']] += 1
+            return json_file_path, article_data, title, article_folder, best_image_data, mtime
             
+        except Exception as e:
+            self.logger.error(f"Failed to process {json_file_path}: {e}")
+            return None
+
+    def _save_article(self, job: Tuple[Path, Dict, str, Path, Optional[Dict], float]) -> bool:
+        """
+        Download the chosen image and write the article JSON (second half).
+        
+        Returns:
+            True if processing was successful
+        """
+        json_file_path, article_data, title, article_folder, best_image_data, mtime = job
+        try:
             if not best_image_data:
                 self.logger.warning(f"No suitable image found for: {title}")
                 # Still create the JSON file even without image
@@ -840,8 +1529,7 @@ class ImageScraperPipeline:
                 article_data['processing_timestamp'] = time.time()
                 
                 output_json_path = article_folder / 'article_data.json'
-                with open(output_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(article_data, f, indent=2, ensure_ascii=False)
+                _write_json(output_json_path, article_data)
                 
                 return True
             
@@ -859,9 +1547,12 @@ class ImageScraperPipeline:
                     'source_method': best_image_data['source']
                 }
                 self.logger.info(f"Downloaded best image for: {title} (score: {best_image_data['score']})")
+                # Only a pick that could actually be saved is reused next run
+                self._store_result(json_file_path, article_data['url'], mtime, best_image_data)
             else:
                 self.logger.error(f"Failed to download image for: {title}")
                 image_info = None
+                self._forget_result(json_file_path)
             
             # Update article data with image information
             article_data['image'] = image_info
@@ -869,8 +1560,7 @@ class ImageScraperPipeline:
             
             # Save updated JSON
             output_json_path = article_folder / 'article_data.json'
-            with open(output_json_path, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, indent=2, ensure_ascii=False)
+            _write_json(output_json_path, article_data)
             
             success_msg = f"Completed: {title}"
             if image_info:
@@ -891,42 +1581,176 @@ class ImageScraperPipeline:
         Returns:
             Dictionary with processing statistics
         """
-        # Find all JSON files
-        json_files = list(self.input_folder.glob('*.json'))
+        # Stream the JSON files so work starts before the directory is fully read
+        json_files = _iter_json_files(self.input_folder)
+        first = next(json_files, None)
         
-        if not json_files:
+        if first is None:
             self.logger.warning(f"No JSON files found in {self.input_folder}")
             return {'total': 0, 'successful': 0, 'failed': 0}
         
-        self.logger.info(f"Found {len(json_files)} JSON files to process")
+        self.logger.info(f"Processing JSON files from {self.input_folder}")
+        json_files = chain([first], json_files)
         
-        # Process each file
-        successful = 0
-        failed = 0
+        if self.processes > 1:
+            successful, failed = self._process_files_in_processes(json_files)
+        else:
+            successful, failed = self.process_files(json_files)
         
-        for json_file in json_files:
-            try:
-                if self.process_article(json_file):
-                    successful += 1
-                else:
-                    failed += 1
-            except KeyboardInterrupt:
-                self.logger.info("Pipeline interrupted by user")
-                break
-            except Exception as e:
-                self.logger.error(f"Unexpected error processing {json_file}: {e}")
-                failed += 1
+        # Every file ends up counted as either successful or failed
+        total = successful + failed
         
         # Final statistics
         stats = {
-            'total': len(json_files),
+            'total': total,
             'successful': successful,
             'failed': failed
         }
         
-        self.logger.info(f"Pipeline completed: {successful}/{len(json_files)} articles processed successfully")
+        self.logger.info(f"Pipeline completed: {successful}/{total} articles processed successfully")
+        if self.source_wins:
+            wins = ', '.join(f"{source}: {count}" for source, count in self.source_wins.most_common())
+            self.logger.info(f"Chosen images by source: {wins}")
         return stats
 
+    def process_files(self, json_files: Iterable[Path]) -> Tuple[int, int]:
+        """
+        Process JSON files concurrently on this pipeline's thread pools.
+        
+        Articles are scraped on the article pool; as each one finishes, its
+        image download and JSON write move to the download pool so the article
+        thread can start scraping the next file. Files are pulled from
+        json_files only while fewer than QUEUE_SIZE are queued or in flight,
+        so a huge input folder is never held in memory at once.
+        
+        Args:
+            json_files: JSON files to process (any iterable, consumed lazily)
+            
+        Returns:
+            Tuple of (successful, failed) counts
+        """
+        # Each article is dominated by network waits, so threads overlap them
+        successful = 0
+        failed = 0
+        
+        json_files = iter(json_files)
+        queue_size = max(config.QUEUE_SIZE, self.max_workers)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            saves = {}
+            try:
+                while True:
+                    # Top up the queue; pending saves count against it too, so
+                    # slow downloads hold back reading more files
+                    for json_file in islice(json_files, queue_size - len(futures) - len(saves)):
+                        futures[executor.submit(self._scrape_article, json_file)] = json_file
+                    if not futures and not saves:
+                        break
+                    
+                    done, _ = wait(list(futures) + list(saves), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in futures:
+                            json_file = futures.pop(future)
+                            try:
+                                job = future.result()
+                            except Exception as e:
+                                self.logger.error(f"Unexpected error processing {json_file}: {e}")
+                                job = None
+                            if job is None:
+                                failed += 1
+                            else:
+                                saves[self._download_pool.submit(self._save_article, job)] = json_file
+                        else:
+                            json_file = saves.pop(future)
+                            try:
+                                if future.result():
+                                    successful += 1
+                                else:
+                                    failed += 1
+                            except Exception as e:
+                                self.logger.error(f"Unexpected error processing {json_file}: {e}")
+                                failed += 1
+            except KeyboardInterrupt:
+                self.logger.info("Pipeline interrupted by user")
+                for future in list(futures) + list(saves):
+                    future.cancel()
+        
+        return successful, failed
+
+    def _process_files_in_processes(self, json_files: Iterable[Path]) -> Tuple[int, int]:
+        """
+        Spread the JSON files across worker processes.
+        
+        Parsing and JPEG encoding are CPU-bound and serialized by the GIL within
+        one process. Each worker builds its own pipeline (and HTTP session) once,
+        then takes small batches of files and runs each batch on its own thread
+        pool, so a slow batch never leaves the other processes idle. Batches
+        are cut from json_files as workers free up, two per process at most.
+        
+        Returns:
+            Tuple of (successful, failed) counts
+        """
+        batch_size = self.max_workers * 2
+        json_files = iter(json_files)
+        batches = iter(lambda: list(islice(json_files, batch_size)), [])
+        
+        # Look ahead far enough to know whether the extra processes are needed
+        first_batches = list(islice(batches, self.processes))
+        if len(first_batches) == 1:
+            return self.process_files(first_batches[0])
+        processes = len(first_batches)
+        self.logger.info(f"Processing files across {processes} worker processes")
+        batches = chain(first_batches, batches)
+        
+        successful = 0
+        failed = 0
+        
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(self.input_folder, self.output_folder, self.max_workers)) as executor:
+            futures = {}
+            try:
+                while True:
+                    for batch in islice(batches, processes * 2 - len(futures)):
+                        futures[executor.submit(_process_files_worker, batch)] = batch
+                    if not futures:
+                        break
+                    
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch = futures.pop(future)
+                        try:
+                            done_count, errors, wins = future.result()
+                            successful += done_count
+                            failed += errors
+                            self.source_wins.update(wins)
+                        except Exception as e:
+                            self.logger.error(f"Worker process failed: {e}")
+                            failed += len(batch)
+            except KeyboardInterrupt:
+                self.logger.info("Pipeline interrupted by user")
+                for future in futures:
+                    future.cancel()
+        
+        return successful, failed
+
+
+# Pipeline owned by a worker process, built once by the pool initializer
+_worker_pipeline = None
+
+
+def _init_worker(input_folder: Path, output_folder: Path, max_workers: int) -> None:
+    """Create the worker process's pipeline; sessions and caches never cross processes."""
+    global _worker_pipeline
+    _worker_pipeline = ImageScraperPipeline(input_folder, output_folder, max_workers)
+
+
+def _process_files_worker(json_files: List[Path]) -> Tuple[int, int, Counter]:
+    """Process a batch of JSON files in a worker process; also returns the batch's source wins."""
+    before = _worker_pipeline.source_wins.copy()
+    successful, failed = _worker_pipeline.process_files(json_files)
+    return successful, failed, _worker_pipeline.source_wins - before
+
 
 def main():
     """Main entry point for the script."""
@@ -935,13 +1759,17 @@ def main():
     parser = argparse.ArgumentParser(description='Scrape images from article JSON files')
     parser.add_argument('--input', '-i', default='.', 
                        help='Input folder containing JSON files (default: current directory)')
-    parser.add_argument('--output', '-o', default='articles+images',
-                       help='Output folder for organized articles and images (default: articles+images)')
+    parser.add_argument('--output', '-o', default=config.OUTPUT_FOLDER,
+                       help=f'Output folder for organized articles and images (default: {config.OUTPUT_FOLDER})')
+    parser.add_argument('--workers', '-w', type=int, default=config.MAX_WORKERS,
+                       help=f'Number of articles processed concurrently (default: {config.MAX_WORKERS})')
+    parser.add_argument('--processes', '-p', type=int, default=config.PROCESSES,
+                       help=f'Number of worker processes to split the files across (default: {config.PROCESSES})')
     
     args = parser.parse_args()
     
     # Create and run pipeline
-    pipeline = ImageScraperPipeline(args.input, args.output)
+    pipeline = ImageScraperPipeline(args.input, args.output, args.workers, args.processes)
     stats = pipeline.run_pipeline()
     
     print(f"\n=== Pipeline Results ===")
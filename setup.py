@@ -20,6 +20,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/article-image-scraper",
     packages=find_packages(),
+    py_modules=["image_scraper_pipeline", "config"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",